@@ -99,7 +99,7 @@ class BugzillaClient:
             matching_comments = [c for c in comment_list if c.id == bug.comment.id]
             # If no matching entry is found, set `bug.comment` to `None`.
             found = matching_comments[0] if matching_comments else None
-            bug = bug.model_copy(update={"comment": found}, deep=True)
+            bug = bug.model_copy(update={"comment": found})
         return bug
 
     @instrumented_method
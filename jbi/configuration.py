@@ -3,6 +3,7 @@ Parsing and validating the YAML configuration occurs within this module
 """
 
 import logging
+from functools import lru_cache
 
 from pydantic import ValidationError
 from pydantic_yaml import parse_yaml_raw_as
@@ -17,8 +18,13 @@ class ConfigError(Exception):
     """Error when an exception occurs during processing config"""
 
 
+@lru_cache
 def get_actions_from_file(jbi_config_file: str) -> Actions:
-    """Convert and validate YAML configuration to `Action` objects"""
+    """Convert and validate YAML configuration to `Action` objects.
+
+    The result is cached per file, since actions are loaded on every
+    incoming webhook request.
+    """
     try:
         with open(jbi_config_file, encoding="utf8") as file:
             content = file.read()
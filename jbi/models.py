@@ -214,7 +214,7 @@ class Actions(RootModel):
 
         return actions
 
-    model_config = ConfigDict(ignored_types=(functools.cached_property,))
+    model_config = ConfigDict(frozen=True, ignored_types=(functools.cached_property,))
 
 
 class Context(BaseModel, frozen=True):
@@ -23,13 +23,13 @@ Classes:
 """
 
 import logging
+import os
 import re
 import tempfile
 import traceback
 from abc import ABC, abstractmethod
 from datetime import datetime
 from functools import cached_property, lru_cache
-from json import JSONDecodeError
 from pathlib import Path
 from typing import AsyncIterator, Optional
 from urllib.parse import ParseResult, urlparse
@@ -45,10 +45,12 @@ logger = logging.getLogger(__name__)
 ITEM_ID_PATTERN = re.compile(
     r"(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\+\d{2}:\d{2})-(?P<bug_id>\d+)-(?P<action>\w*)-(?P<status>error|postponed)"
 )
+# Bug folders are named after the bug id, unlike the temp files from checks.
+BUG_FOLDER_PATTERN = re.compile(r"\d+")
 
 
 def extract_bug_id_from_item_id(item_id: str) -> str:
-    if match := re.search(ITEM_ID_PATTERN, item_id):
+    if match := ITEM_ID_PATTERN.search(item_id):
         return match.group("bug_id")
     raise ValueError(
         "item_id %s did not match expected format: %s", item_id, ITEM_ID_PATTERN.pattern
@@ -207,7 +209,9 @@ class FileBackend(QueueBackend):
             item.payload.bug.id,
             path,
         )
-        logger.debug("%d items in dead letter queue", await self.size())
+        if logger.isEnabledFor(logging.DEBUG):
+            # Counting walks the whole queue folder, only do it when logged.
+            logger.debug("%d items in dead letter queue", await self.size())
 
     async def remove(self, bug_id: int, identifier: str):
         bug_dir = self.location / f"{bug_id}"
@@ -244,19 +248,20 @@ class FileBackend(QueueBackend):
             yield
         for path in sorted(folder.iterdir()):
             try:
-                yield QueueItem.parse_file(path)
-            except (JSONDecodeError, ValidationError) as e:
+                yield QueueItem.model_validate_json(path.read_bytes())
+            except ValidationError as e:
                 raise QueueItemRetrievalError(
                     "Unable to load item from queue", path=path
                 ) from e
 
     async def get_all(self) -> dict[int, AsyncIterator[QueueItem]]:
         all_items: dict[int, AsyncIterator[QueueItem]] = {}
-        for filesystem_object in self.location.iterdir():
-            if filesystem_object.is_dir() and re.match(
-                r"\d", filesystem_object.name
-            ):  # filtering out temp files from checks
-                all_items[int(filesystem_object.name)] = self.get(filesystem_object)
+        # `scandir()` entries know their type, sparing a `stat()` per folder.
+        with os.scandir(self.location) as entries:
+            for entry in entries:
+                if entry.is_dir() and BUG_FOLDER_PATTERN.fullmatch(entry.name):
+                    bug_id = int(entry.name)
+                    all_items[bug_id] = self.get(bug_id)
         return all_items
 
     async def size(self, bug_id=None) -> int:
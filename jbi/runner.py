@@ -6,6 +6,7 @@ import inspect
 import itertools
 import logging
 import re
+from functools import lru_cache
 from typing import Optional
 
 from dockerflow.logging import request_id_context
@@ -50,14 +51,20 @@ def groups2operation(steps: ActionSteps):
     """
     try:
         by_operation = {
-            GROUP_TO_OPERATION[entry]: steps_list
-            for entry, steps_list in steps.model_dump().items()
+            GROUP_TO_OPERATION[entry]: steps_list for entry, steps_list in steps
         }
     except KeyError as err:
         raise ValueError(f"Unsupported entry in `steps`: {err}") from err
     return by_operation
 
 
+@lru_cache
+def whiteboard_tag_pattern(tag: str) -> re.Pattern:
+    """Compiled pattern matching the given tag in a bug whiteboard."""
+    # [tag-word], [tag-], [tag], but not [word-tag] or [tagword]
+    return re.compile(r"\[" + tag + r"(-[^\]]*)*\]", flags=re.IGNORECASE)
+
+
 def lookup_action(bug: bugzilla_models.Bug, actions: Actions) -> Action:
     """
     Find first matching action from bug's whiteboard field.
@@ -68,14 +75,18 @@ def lookup_action(bug: bugzilla_models.Bug, actions: Actions) -> Action:
 
     if bug.whiteboard:
         for tag, action in actions.by_tag.items():
-            # [tag-word], [tag-], [tag], but not [word-tag] or [tagword]
-            search_string = r"\[" + tag + r"(-[^\]]*)*\]"
-            if re.search(search_string, bug.whiteboard, flags=re.IGNORECASE):
+            if whiteboard_tag_pattern(tag).search(bug.whiteboard):
                 return action
 
     raise ActionNotFoundError(", ".join(actions.by_tag.keys()))
 
 
+@lru_cache
+def step_parameter_names(func) -> frozenset[str]:
+    """Names of the parameters of a step function, inspected once per step."""
+    return frozenset(inspect.signature(func).parameters)
+
+
 class Executor:
     """Callable class that runs step functions for an action."""
 
@@ -111,11 +122,11 @@ class Executor:
         Returns:
             A dictionary containing the kwargs that match the parameters of the function.
         """
-        function_params = inspect.signature(func).parameters
+        function_params = step_parameter_names(func)
         return {
             key: value
             for key, value in self.step_func_params.items()
-            if key in function_params.keys()
+            if key in function_params
         }
 
     def __call__(self, context: ActionContext) -> ActionResult:
@@ -146,15 +157,17 @@ class Executor:
             step_responses = context.responses_by_step[step.__name__]
             if step_responses:
                 has_produced_request = True
-            for response in step_responses:
-                logger.info(
-                    "Received %s",
-                    response,
-                    extra={
-                        "response": response,
-                        **context.model_dump(),
-                    },
-                )
+                # Serialize the context once for all the responses of this step.
+                context_dump = context.model_dump()
+                for response in step_responses:
+                    logger.info(
+                        "Received %s",
+                        response,
+                        extra={
+                            "response": response,
+                            **context_dump,
+                        },
+                    )
 
         # Flatten the list of all received responses.
         responses = list(
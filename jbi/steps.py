@@ -387,15 +387,13 @@ def maybe_update_components(
 def _whiteboard_as_labels(labels_brackets: str, whiteboard: Optional[str]) -> list[str]:
     """Split the whiteboard string into a list of labels"""
     splitted = whiteboard.replace("[", "").split("]") if whiteboard else []
-    stripped = [x.strip() for x in splitted if x not in ["", " "]]
     # Jira labels can't contain a " ", convert to "."
-    nospace = [wb.replace(" ", ".") for wb in stripped]
-    with_brackets = [f"[{wb}]" for wb in nospace]
+    nospace = [x.strip().replace(" ", ".") for x in splitted if x not in ("", " ")]
 
     if labels_brackets == "yes":
-        labels = with_brackets
+        labels = [f"[{wb}]" for wb in nospace]
     elif labels_brackets == "both":
-        labels = nospace + with_brackets
+        labels = nospace + [f"[{wb}]" for wb in nospace]
     else:
         labels = nospace
 
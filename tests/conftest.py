@@ -9,10 +9,12 @@ import pytest
 import responses
 from fastapi.testclient import TestClient
 from pytest_factoryboy import register
+from responses import registries
 
 import jbi.app
 import tests.fixtures.factories as factories
 from jbi import Operation, bugzilla, jira
+from jbi.common import instrument
 from jbi.environment import Settings
 from jbi.models import ActionContext
 from jbi.queue import DeadLetterQueue, get_dl_queue
@@ -29,11 +31,10 @@ class FilteredLogCaptureFixture(pytest.LogCaptureFixture):
     @property
     def records(self):
         """Return filtered list of messages"""
-        return [
-            r
-            for r in super().records
-            if not self.logger_name or r.name == self.logger_name
-        ]
+        records = super().records
+        if not self.logger_name:
+            return list(records)
+        return [r for r in records if r.name == self.logger_name]
 
     def for_logger(self, logger_name):
         """Specify logger to filter captured messages"""
@@ -51,7 +52,7 @@ def capturelogs(request):
 
 @pytest.fixture(autouse=True)
 def mocked_statsd():
-    with mock.patch("jbi.common.instrument.statsd") as _mocked_statsd:
+    with mock.patch.object(instrument, "statsd") as _mocked_statsd:
         yield _mocked_statsd
 
 
@@ -65,7 +66,7 @@ register(factories.CommentFactory)
 register(factories.JiraContextFactory)
 register(factories.WebhookEventFactory)
 register(factories.WebhookEventChangeFactory)
-register(factories.WebhookRequestFactory, "bugzilla_webhook_request")
+register(factories.WebhookRequestFactory)
 register(factories.WebhookUserFactory)
 register(factories.QueueItemFactory)
 
@@ -75,6 +76,12 @@ register(
 )
 
 
+@pytest.fixture(scope="session")
+def bugzilla_webhook_request():
+    """A default webhook request, shared by tests since Bugzilla models are frozen"""
+    return factories.WebhookRequestFactory()
+
+
 @pytest.fixture
 def app(dl_queue):
     app = jbi.app.app
@@ -102,15 +109,16 @@ def authenticated_client(app, test_api_key):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def settings():
     """A test Settings object"""
     return Settings()
 
 
-@pytest.fixture()
-def actions(actions_factory):
-    return actions_factory()
+@pytest.fixture(scope="session")
+def actions():
+    """Default actions, only read by tests and thus shared by all of them"""
+    return factories.ActionsFactory()
 
 
 @pytest.fixture
@@ -124,25 +132,29 @@ def dl_queue(tmp_path):
 
 
 @pytest.fixture(autouse=True)
-def mocked_bugzilla(request):
+def mocked_bugzilla(request, monkeypatch):
     if "no_mocked_bugzilla" in request.keywords:
         yield None
-        bugzilla.service.get_service.cache_clear()
     else:
-        with mock.patch("jbi.bugzilla.service.BugzillaClient") as mocked_bz:
-            yield mocked_bz()
-            bugzilla.service.get_service.cache_clear()
+        mocked_bz = mock.MagicMock(spec=bugzilla.client.BugzillaClient)
+        monkeypatch.setattr(
+            bugzilla.service, "BugzillaClient", lambda *args, **kwargs: mocked_bz
+        )
+        yield mocked_bz
+    bugzilla.service.get_service.cache_clear()
 
 
 @pytest.fixture(autouse=True)
-def mocked_jira(request):
+def mocked_jira(request, monkeypatch):
     if "no_mocked_jira" in request.keywords:
         yield None
-        jira.get_service.cache_clear()
     else:
-        with mock.patch("jbi.jira.service.JiraClient") as mocked_jira:
-            yield mocked_jira()
-            jira.get_service.cache_clear()
+        mocked_jira = mock.MagicMock(spec=jira.client.JiraClient)
+        monkeypatch.setattr(
+            jira.service, "JiraClient", lambda *args, **kwargs: mocked_jira
+        )
+        yield mocked_jira
+    jira.get_service.cache_clear()
 
 
 @pytest.fixture
@@ -152,8 +164,15 @@ def mocked_responses():
 
 
 @pytest.fixture
-def context_comment_example(action_context_factory) -> ActionContext:
-    return action_context_factory(
+def mocked_ordered_responses():
+    """Mocked responses that are returned in the order they were registered."""
+    with responses.RequestsMock(registry=registries.OrderedRegistry) as rsps:
+        yield rsps
+
+
+@pytest.fixture(scope="session")
+def context_comment_example() -> ActionContext:
+    return factories.ActionContextFactory(
         operation=Operation.COMMENT,
         bug__see_also=["https://mozilla.atlassian.net/browse/JBI-234"],
         bug__with_comment=True,
@@ -165,9 +184,9 @@ def context_comment_example(action_context_factory) -> ActionContext:
     )
 
 
-@pytest.fixture
-def context_attachment_example(action_context_factory) -> ActionContext:
-    return action_context_factory(
+@pytest.fixture(scope="session")
+def context_attachment_example() -> ActionContext:
+    return factories.ActionContextFactory(
         operation=Operation.ATTACHMENT,
         bug__see_also=["https://mozilla.atlassian.net/browse/JBI-234"],
         event__target="attachment",
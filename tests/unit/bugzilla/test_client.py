@@ -3,6 +3,7 @@ import requests
 import responses
 from responses import matchers
 
+import tests.fixtures.factories as factories
 from jbi.bugzilla.client import (
     BugNotAccessibleError,
     BugzillaClient,
@@ -10,34 +11,33 @@ from jbi.bugzilla.client import (
 )
 
 
-@pytest.fixture
-def webhook_private_comment_example(
-    webhook_user_factory, webhook_event_factory, bug_factory, webhook_request_factory
-):
-    user = webhook_user_factory(login="mathieu@mozilla.org")
-    event = webhook_event_factory(target="comment", user=user)
-    bug = bug_factory(
-        comment={"id": 344, "number": 2, "is_private": True},
-        see_also=["https://mozilla.atlassian.net/browse/JBI-234"],
+@pytest.fixture(scope="module")
+def webhook_private_comment_example():
+    return factories.WebhookRequestFactory(
+        event__target="comment",
+        event__user__login="mathieu@mozilla.org",
+        bug__comment={"id": 344, "number": 2, "is_private": True},
+        bug__see_also=["https://mozilla.atlassian.net/browse/JBI-234"],
     )
-    webhook_payload = webhook_request_factory(bug=bug, event=event)
-    return webhook_payload
 
 
-@pytest.fixture
-def bugzilla_client(settings):
-    return BugzillaClient(
-        base_url=settings.bugzilla_base_url, api_key=settings.bugzilla_api_key
-    )
+@pytest.fixture(scope="session")
+def bugzilla_base_url(settings):
+    return settings.bugzilla_base_url
+
+
+@pytest.fixture(scope="module")
+def bugzilla_client(settings, bugzilla_base_url):
+    return BugzillaClient(base_url=bugzilla_base_url, api_key=settings.bugzilla_api_key)
 
 
 @pytest.mark.no_mocked_bugzilla
 def test_timer_is_used_on_bugzilla_get_comments(
-    bugzilla_client, settings, mocked_responses, mocked_statsd
+    bugzilla_client, bugzilla_base_url, mocked_responses, mocked_statsd
 ):
     mocked_responses.add(
         "GET",
-        f"{settings.bugzilla_base_url}/rest/bug/42/comment",
+        f"{bugzilla_base_url}/rest/bug/42/comment",
         json={
             "bugs": {"42": {"comments": []}},
         },
@@ -48,11 +48,11 @@ def test_timer_is_used_on_bugzilla_get_comments(
 
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_methods_are_retried_if_raising(
-    bugzilla_client, settings, mocked_responses
+    bugzilla_client, bugzilla_base_url, mocked_ordered_responses
 ):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42/comment"
-    mocked_responses.add(responses.GET, url, status=503, json={})
-    mocked_responses.add(
+    url = f"{bugzilla_base_url}/rest/bug/42/comment"
+    mocked_ordered_responses.add(responses.GET, url, status=503, json={})
+    mocked_ordered_responses.add(
         responses.GET,
         url,
         json={
@@ -63,12 +63,14 @@ def test_bugzilla_methods_are_retried_if_raising(
     # Not raising
     bugzilla_client.get_comments(42)
 
-    assert len(mocked_responses.calls) == 2
+    assert len(mocked_ordered_responses.calls) == 2
 
 
 @pytest.mark.no_mocked_bugzilla
-def test_bugzilla_key_is_passed_in_header(bugzilla_client, settings, mocked_responses):
-    url = f"{settings.bugzilla_base_url}/rest/whoami"
+def test_bugzilla_key_is_passed_in_header(
+    bugzilla_client, bugzilla_base_url, mocked_responses
+):
+    url = f"{bugzilla_base_url}/rest/whoami"
     mocked_responses.add(
         responses.GET,
         url,
@@ -87,9 +89,9 @@ def test_bugzilla_key_is_passed_in_header(bugzilla_client, settings, mocked_resp
 
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_raises_if_response_has_error(
-    bugzilla_client, settings, mocked_responses
+    bugzilla_client, bugzilla_base_url, mocked_responses
 ):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42"
+    url = f"{bugzilla_base_url}/rest/bug/42"
     mocked_responses.add(
         responses.GET, url, json={"error": True, "message": "not happy"}
     )
@@ -101,41 +103,31 @@ def test_bugzilla_raises_if_response_has_error(
 
 
 @pytest.mark.no_mocked_bugzilla
-def test_bugzilla_get_bug_raises_if_response_is_401_and_credentials_invalid(
-    bugzilla_client, settings, mocked_responses
-):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42"
-    mocked_responses.add(
-        responses.GET,
-        url,
-        status=401,
-        json={
-            "code": 102,
-            "documentation": "https://bmo.readthedocs.io/en/latest/api/",
-            "error": True,
-            "message": "You are not authorized to access bug 42.",
-        },
-    )
-    mocked_responses.add(
-        responses.GET,
-        f"{settings.bugzilla_base_url}/rest/whoami",
-        status=401,
-    )
-
-    with pytest.raises(requests.HTTPError) as exc:
-        bugzilla_client.get_bug(42)
-
-    assert (
-        f"401 Client Error: Unauthorized for url: {settings.bugzilla_base_url}/rest/bug/42"
-        in str(exc)
-    )
-
-
-@pytest.mark.no_mocked_bugzilla
-def test_bugzilla_get_bug_raises_if_response_is_401_and_credentials_valid(
-    bugzilla_client, settings, mocked_responses
+@pytest.mark.parametrize(
+    "whoami_response,expected_exception,expected_message",
+    [
+        (
+            {"status": 401},
+            requests.HTTPError,
+            "401 Client Error: Unauthorized for url: {base_url}/rest/bug/42",
+        ),
+        (
+            {"json": {"id": "you"}},
+            BugNotAccessibleError,
+            "You are not authorized to access bug 42",
+        ),
+    ],
+    ids=["credentials_invalid", "credentials_valid"],
+)
+def test_bugzilla_get_bug_raises_if_response_is_401(
+    bugzilla_client,
+    bugzilla_base_url,
+    mocked_responses,
+    whoami_response,
+    expected_exception,
+    expected_message,
 ):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42"
+    url = f"{bugzilla_base_url}/rest/bug/42"
     mocked_responses.add(
         responses.GET,
         url,
@@ -149,21 +141,21 @@ def test_bugzilla_get_bug_raises_if_response_is_401_and_credentials_valid(
     )
     mocked_responses.add(
         responses.GET,
-        f"{settings.bugzilla_base_url}/rest/whoami",
-        json={"id": "you"},
+        f"{bugzilla_base_url}/rest/whoami",
+        **whoami_response,
     )
 
-    with pytest.raises(BugNotAccessibleError) as exc:
+    with pytest.raises(expected_exception) as exc:
         bugzilla_client.get_bug(42)
 
-    assert "You are not authorized to access bug 42" in str(exc)
+    assert expected_message.format(base_url=bugzilla_base_url) in str(exc)
 
 
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_get_bug_raises_if_response_has_no_bugs(
-    bugzilla_client, settings, mocked_responses
+    bugzilla_client, bugzilla_base_url, mocked_responses
 ):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42"
+    url = f"{bugzilla_base_url}/rest/bug/42"
     mocked_responses.add(responses.GET, url, json={"bugs": []})
 
     with pytest.raises(BugzillaClientError) as exc:
@@ -174,9 +166,9 @@ def test_bugzilla_get_bug_raises_if_response_has_no_bugs(
 
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_get_comments_raises_if_response_has_no_bugs(
-    bugzilla_client, settings, mocked_responses
+    bugzilla_client, bugzilla_base_url, mocked_responses
 ):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42/comment"
+    url = f"{bugzilla_base_url}/rest/bug/42/comment"
     mocked_responses.add(responses.GET, url, json={"bugs": {"42": {}}})
 
     with pytest.raises(BugzillaClientError) as exc:
@@ -186,8 +178,10 @@ def test_bugzilla_get_comments_raises_if_response_has_no_bugs(
 
 
 @pytest.mark.no_mocked_bugzilla
-def test_bugzilla_update_bug_uses_a_put(bugzilla_client, settings, mocked_responses):
-    url = f"{settings.bugzilla_base_url}/rest/bug/42"
+def test_bugzilla_update_bug_uses_a_put(
+    bugzilla_client, bugzilla_base_url, mocked_responses
+):
+    url = f"{bugzilla_base_url}/rest/bug/42"
     mocked_responses.add(responses.PUT, url, json={"bugs": [{"id": 42}]})
 
     bugzilla_client.update_bug(42, see_also={"add": ["http://url.com"]})
@@ -200,12 +194,14 @@ def test_bugzilla_update_bug_uses_a_put(bugzilla_client, settings, mocked_respon
 
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_get_bug_comment(
-    bugzilla_client, settings, mocked_responses, webhook_private_comment_example
+    bugzilla_client,
+    bugzilla_base_url,
+    mocked_responses,
+    webhook_private_comment_example,
 ):
     # given
     bug_url = (
-        f"{settings.bugzilla_base_url}/rest/bug/%s"
-        % webhook_private_comment_example.bug.id
+        f"{bugzilla_base_url}/rest/bug/%s" % webhook_private_comment_example.bug.id
     )
     mocked_responses.add(
         responses.GET,
@@ -254,13 +250,12 @@ def test_bugzilla_get_bug_comment(
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_missing_private_comment(
     bugzilla_client,
-    settings,
+    bugzilla_base_url,
     mocked_responses,
     webhook_private_comment_example,
 ):
     bug_url = (
-        f"{settings.bugzilla_base_url}/rest/bug/%s"
-        % webhook_private_comment_example.bug.id
+        f"{bugzilla_base_url}/rest/bug/%s" % webhook_private_comment_example.bug.id
     )
     mocked_responses.add(
         responses.GET,
@@ -282,8 +277,8 @@ def test_bugzilla_missing_private_comment(
 
 
 @pytest.mark.no_mocked_bugzilla
-def test_bugzilla_list_webhooks(bugzilla_client, settings, mocked_responses):
-    url = f"{settings.bugzilla_base_url}/rest/webhooks/list"
+def test_bugzilla_list_webhooks(bugzilla_client, bugzilla_base_url, mocked_responses):
+    url = f"{bugzilla_base_url}/rest/webhooks/list"
     mocked_responses.add(
         responses.GET,
         url,
@@ -313,9 +308,9 @@ def test_bugzilla_list_webhooks(bugzilla_client, settings, mocked_responses):
 
 @pytest.mark.no_mocked_bugzilla
 def test_bugzilla_list_webhooks_raises_if_response_has_no_webhooks(
-    bugzilla_client, settings, mocked_responses
+    bugzilla_client, bugzilla_base_url, mocked_responses
 ):
-    url = f"{settings.bugzilla_base_url}/rest/webhooks/list"
+    url = f"{bugzilla_base_url}/rest/webhooks/list"
     mocked_responses.add(responses.GET, url, json={})
 
     with pytest.raises(BugzillaClientError) as exc:
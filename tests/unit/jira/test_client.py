@@ -6,8 +6,11 @@ import responses
 
 from jbi.jira.client import JiraClient
 
+# `paginated_projects()` accepts up to 50 project keys.
+KEYS_OVER_LIMIT = tuple(str(i) for i in range(51))
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def jira_client(settings):
     return JiraClient(
         url=settings.jira_base_url,
@@ -65,37 +68,32 @@ def test_jira_calls_log_http_errors(
     )
 
 
-def test_paginated_projects_no_keys(settings, jira_client, mocked_responses):
-    url = f"{settings.jira_base_url}rest/api/2/project/search"
-    mocked_response_data = {"some": "data"}
-    mocked_responses.add(
-        responses.GET,
-        url,
-        status=200,
-        match=[responses.matchers.query_string_matcher(None)],
-        json=mocked_response_data,
-    )
-    resp = jira_client.paginated_projects()
-    assert resp == mocked_response_data
-
-
-def test_paginated_projects_with_keys(settings, jira_client, mocked_responses):
+@pytest.mark.parametrize(
+    "keys,query_string",
+    [
+        (None, None),
+        (["ABC", "DEF"], "keys=ABC&keys=DEF"),
+    ],
+    ids=["no_keys", "with_keys"],
+)
+def test_paginated_projects(
+    settings, jira_client, mocked_responses, keys, query_string
+):
     url = f"{settings.jira_base_url}rest/api/2/project/search"
     mocked_response_data = {"some": "data"}
     mocked_responses.add(
         responses.GET,
         url,
         status=200,
-        match=[responses.matchers.query_string_matcher("keys=ABC&keys=DEF")],
+        match=[responses.matchers.query_string_matcher(query_string)],
         json=mocked_response_data,
     )
-    resp = jira_client.paginated_projects(keys=["ABC", "DEF"])
+    resp = jira_client.paginated_projects(keys=keys)
     assert resp == mocked_response_data
 
 
 def test_paginated_projects_greater_than_50_keys(
     settings, jira_client, mocked_responses
 ):
-    keys = [str(i) for i in range(51)]
     with pytest.raises(ValueError):
-        jira_client.paginated_projects(keys=keys)
+        jira_client.paginated_projects(keys=KEYS_OVER_LIMIT)
@@ -9,7 +9,7 @@ from jbi import jira
 from jbi.models import Actions, JiraComponents
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def jira_service(settings):
     client = jira.client.JiraClient(
         url=settings.jira_base_url,
@@ -175,7 +175,7 @@ def test_get_issue_reraises_other_erroring_status_codes(
 
 
 def test_update_issue_status_adds_comment_and_resolution_when_cancelled(
-    jira_service, settings, mocked_responses, action_context_factory, capturelogs
+    jira_service, settings, mocked_responses, action_context_factory
 ):
     context = action_context_factory(jira__issue="JBI-234")
     url = f"{settings.jira_base_url}rest/api/2/issue/JBI-234/transitions"
@@ -4,10 +4,8 @@ import pytest
 
 from jbi.jira.utils import markdown_to_jira
 
-
-def test_markdown_to_jira():
-    markdown = dedent(
-        """
+SAMPLE_MARKDOWN = dedent(
+    """
     Mixed nested lists
 
     * a
@@ -28,10 +26,10 @@ def test_markdown_to_jira():
 
     this was ~~wrong~~.
     """
-    ).lstrip()
+).lstrip()
 
-    jira = dedent(
-        """
+SAMPLE_JIRA = dedent(
+    """
     Mixed nested lists
 
     * a
@@ -53,9 +51,11 @@ def test_markdown_to_jira():
 
     this was -wrong-.
     """
-    ).strip()
+).strip()
+
 
-    assert markdown_to_jira(markdown) == jira
+def test_markdown_to_jira():
+    assert markdown_to_jira(SAMPLE_MARKDOWN) == SAMPLE_JIRA
 
 
 def test_markdown_to_jira_with_malformed_input():
@@ -7,8 +7,8 @@ from jbi.app import traces_sampler
 from jbi.environment import get_settings
 
 
-def test_request_summary_is_logged(caplog, anon_client):
-    with caplog.at_level(logging.INFO):
+def test_request_summary_is_logged(capturelogs, anon_client):
+    with capturelogs.for_logger("request.summary").at_level(logging.INFO):
         # https://fastapi.tiangolo.com/advanced/testing-events/
         anon_client.get(
             "/",
@@ -17,7 +17,7 @@ def test_request_summary_is_logged(caplog, anon_client):
             },
         )
 
-    summary = [r for r in caplog.records if r.name == "request.summary"][0]
+    summary = capturelogs.records[0]
 
     assert summary.rid == "foo-bar"
     assert summary.method == "GET"
@@ -25,27 +25,29 @@ def test_request_summary_is_logged(caplog, anon_client):
     assert summary.querystring == ""
 
 
-def test_request_summary_defaults_user_agent_to_empty_string(caplog, anon_client):
-    with caplog.at_level(logging.INFO):
+def test_request_summary_defaults_user_agent_to_empty_string(capturelogs, anon_client):
+    with capturelogs.for_logger("request.summary").at_level(logging.INFO):
         del anon_client.headers["User-Agent"]
         anon_client.get("/")
 
-        summary = [r for r in caplog.records if r.name == "request.summary"][0]
+        summary = capturelogs.records[0]
 
         assert summary.agent == ""
 
 
-def test_422_errors_are_logged(authenticated_client, webhook_request_factory, caplog):
+def test_422_errors_are_logged(
+    authenticated_client, webhook_request_factory, capturelogs
+):
     webhook = webhook_request_factory.build(bug=None)
 
-    with caplog.at_level(logging.INFO):
+    with capturelogs.for_logger("jbi.app").at_level(logging.INFO):
         authenticated_client.post(
             "/bugzilla_webhook",
             headers={"X-Api-Key": "fake_api_key"},
             data=webhook.model_dump_json(),
         )
 
-    logged = [r for r in caplog.records if r.name == "jbi.app"][0]
+    logged = capturelogs.records[0]
     assert logged.errors[0]["loc"] == ("body", "bug")
     assert (
         logged.errors[0]["msg"]
@@ -95,7 +97,7 @@ async def test_errors_are_reported_to_sentry(anon_client, bugzilla_webhook_reque
 
 @pytest.mark.asyncio
 async def test_request_id_is_passed_down_to_logger_contexts(
-    caplog,
+    capturelogs,
     bugzilla_webhook_request,
     authenticated_client,
     mocked_jira,
@@ -105,7 +107,7 @@ async def test_request_id_is_passed_down_to_logger_contexts(
     mocked_jira.create_issue.return_value = {
         "key": "JBI-1922",
     }
-    with caplog.at_level(logging.DEBUG):
+    with capturelogs.for_logger("jbi.runner").at_level(logging.DEBUG):
         authenticated_client.post(
             "/bugzilla_webhook",
             data=bugzilla_webhook_request.model_dump_json(),
@@ -114,5 +116,4 @@ async def test_request_id_is_passed_down_to_logger_contexts(
             },
         )
 
-    runner_logs = [r for r in caplog.records if r.name == "jbi.runner"]
-    assert runner_logs[0].rid == "foo-bar"
+    assert capturelogs.records[0].rid == "foo-bar"
@@ -11,13 +11,11 @@ def test_mock_jbi_files():
     assert "Errors exist" in str(exc_info.value)
 
 
-def test_actual_jbi_files():
-    assert configuration.get_actions_from_file(
-        jbi_config_file="config/config.nonprod.yaml"
-    )
-    assert configuration.get_actions_from_file(
-        jbi_config_file="config/config.prod.yaml"
-    )
+@pytest.mark.parametrize(
+    "jbi_config_file", ["config/config.nonprod.yaml", "config/config.prod.yaml"]
+)
+def test_actual_jbi_files(jbi_config_file):
+    assert configuration.get_actions_from_file(jbi_config_file=jbi_config_file)
 
 
 def test_filename_uses_env(mocker, settings):
@@ -27,3 +25,20 @@ def test_filename_uses_env(mocker, settings):
     configuration.get_actions()
 
     get_actions_from_file_spy.assert_called_with("config/config.local.yaml")
+
+
+@pytest.fixture
+def empty_actions_cache():
+    configuration.get_actions_from_file.cache_clear()
+    yield
+    configuration.get_actions_from_file.cache_clear()
+
+
+def test_actions_are_loaded_once_per_file(mocker, empty_actions_cache):
+    parse_spy = mocker.spy(configuration, "parse_yaml_raw_as")
+
+    first = configuration.get_actions_from_file("config/config.local.yaml")
+    second = configuration.get_actions_from_file("config/config.local.yaml")
+
+    assert first is second
+    parse_spy.assert_called_once()
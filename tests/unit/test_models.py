@@ -88,7 +88,7 @@ def test_override_step_configuration_for_single_action_type():
     ],
 )
 def test_extract_see_also(see_also, expected, bug_factory):
-    bug = bug_factory(see_also=see_also)
+    bug = bug_factory.build(see_also=see_also)
     assert bug.extract_from_see_also("JBI") == expected
 
 
@@ -102,7 +102,7 @@ def test_extract_see_also(see_also, expected, bug_factory):
     ],
 )
 def test_product_component(product, component, expected, bug_factory):
-    bug = bug_factory(product=product, component=component)
+    bug = bug_factory.build(product=product, component=component)
     assert bug.product_component == expected
 
 
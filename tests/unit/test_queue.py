@@ -35,13 +35,13 @@ def test_ping(backend: QueueBackend):
     assert backend.ping() is True
 
 
-def test_filebackend_ping_fails(caplog, tmp_path):
+def test_filebackend_ping_fails(tmp_path):
     tmp_path.chmod(0o400)  # set to readonly
     backend = FileBackend(tmp_path)
     assert backend.ping() is False
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_remove_last_item(backend: QueueBackend, queue_item_factory):
     """When we remove the last item for a bug, we also remove it's key from the
     backend"""
@@ -55,7 +55,7 @@ async def test_backend_remove_last_item(backend: QueueBackend, queue_item_factor
     assert await backend.size() == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_clear(backend: QueueBackend, queue_item_factory):
     item_1 = queue_item_factory(payload__bug__id=123)
     item_2 = queue_item_factory(payload__bug__id=456)
@@ -68,7 +68,7 @@ async def test_backend_clear(backend: QueueBackend, queue_item_factory):
     assert await backend.size() == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_put_maintains_sorted_order(
     backend: QueueBackend, queue_item_factory
 ):
@@ -87,7 +87,7 @@ async def test_backend_put_maintains_sorted_order(
     assert list(items) == [item_1, item_2, item_3, item_4]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_ordering(backend: QueueBackend, queue_item_factory):
     now = datetime.now()
     item_1 = queue_item_factory(payload__event__time=now + timedelta(minutes=1))
@@ -107,7 +107,7 @@ async def test_backend_get_ordering(backend: QueueBackend, queue_item_factory):
     assert exptected_id_order == item_metadata
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_all(backend: QueueBackend, queue_item_factory):
     now = datetime.now()
     item_1 = queue_item_factory(
@@ -134,7 +134,7 @@ async def test_backend_get_all(backend: QueueBackend, queue_item_factory):
     assert [item async for item in items[456]] == [item_2, item_4]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_all_invalid_json(backend: QueueBackend, queue_item_factory):
     item_1 = queue_item_factory()
     await backend.put(item_1)
@@ -149,7 +149,7 @@ async def test_backend_get_all_invalid_json(backend: QueueBackend, queue_item_fa
     assert len(items) == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_all_ignores_bad_folders(
     backend: QueueBackend, queue_item_factory
 ):
@@ -158,12 +158,14 @@ async def test_backend_get_all_ignores_bad_folders(
 
     corrupt_file_dir = backend.location / "abc"
     corrupt_file_dir.mkdir()
+    digit_prefixed_dir = backend.location / "1tmp"
+    digit_prefixed_dir.mkdir()
 
     items = await backend.get_all()
     assert len(items) == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_all_payload_doesnt_match_schema(
     backend: QueueBackend, queue_item_factory
 ):
@@ -180,7 +182,7 @@ async def test_backend_get_all_payload_doesnt_match_schema(
     assert len(items) == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_invalid_json(backend: QueueBackend, queue_item_factory):
     corrupt_file_dir = backend.location / "999"
     corrupt_file_dir.mkdir()
@@ -193,7 +195,7 @@ async def test_backend_get_invalid_json(backend: QueueBackend, queue_item_factor
         await anext(items)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_missing_timezone(backend: QueueBackend, queue_item_factory):
     item = queue_item_factory.build(payload__bug__id=666)
     dump = item.model_dump()
@@ -211,7 +213,7 @@ async def test_get_missing_timezone(backend: QueueBackend, queue_item_factory):
     assert "2024-04-18T12:46:54Z" in item.model_dump_json(), "timezone put in dump"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_backend_get_payload_doesnt_match_schema(
     backend: QueueBackend, queue_item_factory
 ):
@@ -238,12 +240,12 @@ def test_check_writable_not_writable(queue: DeadLetterQueue, tmp_path):
     assert failure.id == "queue.backend.ping"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_check_readable_ok(queue: DeadLetterQueue):
     assert await queue.check_readable() == []
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_check_readable_not_parseable(queue: DeadLetterQueue):
     corrupt_file_dir = queue.backend.location / "999"
     corrupt_file_dir.mkdir()
@@ -255,7 +257,7 @@ async def test_check_readable_not_parseable(queue: DeadLetterQueue):
     assert failure.hint.startswith("check that parked event files are not corrupt")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_postpone(queue: DeadLetterQueue, webhook_request_factory):
     webhook_payload = webhook_request_factory()
     await queue.postpone(webhook_payload, rid="rid")
@@ -265,7 +267,7 @@ async def test_postpone(queue: DeadLetterQueue, webhook_request_factory):
     assert item.rid == "rid"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_track_failed(queue: DeadLetterQueue, webhook_request_factory):
     webhook_payload = webhook_request_factory()
     exc = Exception("boom")
@@ -279,7 +281,7 @@ async def test_track_failed(queue: DeadLetterQueue, webhook_request_factory):
     assert item.rid == "rid"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_is_blocked(
     queue: DeadLetterQueue, queue_item_factory, webhook_request_factory
 ):
@@ -293,7 +295,7 @@ async def test_is_blocked(
     assert await queue.is_blocked(another_payload) is False
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_size(backend, queue_item_factory):
     item = queue_item_factory(payload__bug__id=1)
     another_item = queue_item_factory(payload__bug__id=2)
@@ -305,13 +307,13 @@ async def test_size(backend, queue_item_factory):
     assert await backend.size(bug_id=1) == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_size_empty(backend, queue_item_factory):
     assert await backend.size() == 0
     assert await backend.size(bug_id=999) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_retrieve(queue: DeadLetterQueue, queue_item_factory):
     bug_ids = (1, 2, 1, 3)
     now = datetime.now()
@@ -332,7 +334,7 @@ async def test_retrieve(queue: DeadLetterQueue, queue_item_factory):
     assert bug_1_items[0].payload.event.time < bug_1_items[1].payload.event.time
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_done(queue: DeadLetterQueue, queue_item_factory):
     item = queue_item_factory()
 
@@ -343,7 +345,7 @@ async def test_done(queue: DeadLetterQueue, queue_item_factory):
     assert await queue.backend.size() == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_delete(queue: DeadLetterQueue, queue_item_factory):
     item = queue_item_factory()
 
@@ -354,7 +356,7 @@ async def test_delete(queue: DeadLetterQueue, queue_item_factory):
     assert await queue.backend.size() == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_exists(queue: DeadLetterQueue, queue_item_factory):
     item = queue_item_factory()
 
@@ -2,7 +2,6 @@ import base64
 import json
 import os
 from datetime import datetime
-from unittest import mock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -357,17 +356,15 @@ def test_read_heartbeat_bugzilla_webhooks_fails(app, mocked_bugzilla, webhook_fa
 
 
 def test_heartbeat_bugzilla_reports_webhooks_errors(
-    app, mocked_bugzilla, webhook_factory
+    app, mocked_bugzilla, webhook_factory, mocker
 ):
     mocked_bugzilla.logged_in.return_value = True
     mocked_bugzilla.list_webhooks.return_value = [
         webhook_factory(id=1, errors=0, product="Remote Settings"),
         webhook_factory(id=2, errors=3, name="Search Toolbar"),
     ]
-    with (
-        mock.patch("jbi.bugzilla.service.statsd") as mocked,
-        TestClient(app) as anon_client,
-    ):
+    mocked = mocker.patch("jbi.bugzilla.service.statsd")
+    with TestClient(app) as anon_client:
         anon_client.get("/__heartbeat__")
 
     mocked.gauge.assert_any_call(
@@ -5,9 +5,8 @@ import pytest
 import requests
 import responses
 
-from jbi import Operation
+from jbi import Operation, runner
 from jbi.bugzilla.client import BugNotAccessibleError
-from jbi.environment import get_settings
 from jbi.errors import ActionNotFoundError, IgnoreInvalidRequestError
 from jbi.models import ActionContext
 from jbi.runner import (
@@ -19,13 +18,25 @@ from jbi.runner import (
 )
 
 
+@pytest.fixture
+def mocked_runner_statsd(monkeypatch):
+    mocked = mock.MagicMock()
+    monkeypatch.setattr(runner, "statsd", mocked)
+    return mocked
+
+
 def test_bugzilla_object_is_always_fetched(
-    mocked_jira, mocked_bugzilla, bugzilla_webhook_request, actions, bug_factory
+    mocked_jira,
+    mocked_bugzilla,
+    bugzilla_webhook_request,
+    actions,
+    bug_factory,
+    settings,
 ):
     # See https://github.com/mozilla/jira-bugzilla-integration/issues/292
     fetched_bug = bug_factory(
         id=bugzilla_webhook_request.bug.id,
-        see_also=[f"{get_settings().jira_base_url}browse/JBI-234"],
+        see_also=[f"{settings.jira_base_url}browse/JBI-234"],
     )
     mocked_bugzilla.get_bug.return_value = fetched_bug
     mocked_jira.get_issue.return_value = {"fields": {"project": {"key": "JBI"}}}
@@ -164,17 +175,30 @@ def test_execution_logging_for_ignored_requests(
     ]
 
 
-def test_action_is_logged_as_success_if_returns_true(
+@pytest.mark.parametrize(
+    "handled,expected_operation",
+    [
+        (True, Operation.SUCCESS),
+        (False, Operation.IGNORE),
+    ],
+    ids=["success_if_returns_true", "ignore_if_returns_false"],
+)
+def test_action_is_logged_according_to_result(
+    handled,
+    expected_operation,
     capturelogs,
     bugzilla_webhook_request,
     actions,
     mocked_bugzilla,
+    monkeypatch,
 ):
     mocked_bugzilla.get_bug.return_value = bugzilla_webhook_request.bug
+    monkeypatch.setattr(
+        runner.Executor, "__call__", lambda self, context: (handled, {})
+    )
 
-    with mock.patch("jbi.runner.Executor.__call__", return_value=(True, {})):
-        with capturelogs.for_logger("jbi.runner").at_level(logging.DEBUG):
-            execute_action(request=bugzilla_webhook_request, actions=actions)
+    with capturelogs.for_logger("jbi.runner").at_level(logging.DEBUG):
+        execute_action(request=bugzilla_webhook_request, actions=actions)
 
     captured_log_msgs = [(r.getMessage(), r.operation) for r in capturelogs.records]
 
@@ -184,60 +208,36 @@ def test_action_is_logged_as_success_if_returns_true(
             "Execute action 'devtest' for Bug 654321",
             Operation.EXECUTE,
         ),
-        ("Action 'devtest' executed successfully for Bug 654321", Operation.SUCCESS),
+        ("Action 'devtest' executed successfully for Bug 654321", expected_operation),
     ]
     assert capturelogs.records[-1].bug["id"] == 654321
     assert capturelogs.records[-1].action["whiteboard_tag"] == "devtest"
 
 
-def test_action_is_logged_as_ignore_if_returns_false(
-    capturelogs,
-    bugzilla_webhook_request,
-    actions,
-    mocked_bugzilla,
-):
-    mocked_bugzilla.get_bug.return_value = bugzilla_webhook_request.bug
-
-    with mock.patch("jbi.runner.Executor.__call__", return_value=(False, {})):
-        with capturelogs.for_logger("jbi.runner").at_level(logging.DEBUG):
-            execute_action(request=bugzilla_webhook_request, actions=actions)
-
-    captured_log_msgs = [(r.getMessage(), r.operation) for r in capturelogs.records]
-
-    assert captured_log_msgs == [
-        ("Handling incoming request", Operation.HANDLE),
-        (
-            "Execute action 'devtest' for Bug 654321",
-            Operation.EXECUTE,
-        ),
-        ("Action 'devtest' executed successfully for Bug 654321", Operation.IGNORE),
-    ]
-
-
 def test_counter_is_incremented_on_ignored_requests(
     webhook_request_factory,
     actions,
     mocked_bugzilla,
+    mocked_runner_statsd,
 ):
     webhoook = webhook_request_factory(bug__whiteboard="foo")
     mocked_bugzilla.get_bug.return_value = webhoook.bug
 
-    with mock.patch("jbi.runner.statsd") as mocked:
-        with pytest.raises(IgnoreInvalidRequestError):
-            execute_action(request=webhoook, actions=actions)
-    mocked.incr.assert_called_with("jbi.bugzilla.ignored.count")
+    with pytest.raises(IgnoreInvalidRequestError):
+        execute_action(request=webhoook, actions=actions)
+    mocked_runner_statsd.incr.assert_called_with("jbi.bugzilla.ignored.count")
 
 
 def test_counter_is_incremented_on_processed_requests(
     bugzilla_webhook_request,
     actions,
     mocked_bugzilla,
+    mocked_runner_statsd,
 ):
     mocked_bugzilla.get_bug.return_value = bugzilla_webhook_request.bug
 
-    with mock.patch("jbi.runner.statsd") as mocked:
-        execute_action(request=bugzilla_webhook_request, actions=actions)
-    mocked.incr.assert_called_with("jbi.bugzilla.processed.count")
+    execute_action(request=bugzilla_webhook_request, actions=actions)
+    mocked_runner_statsd.incr.assert_called_with("jbi.bugzilla.processed.count")
 
 
 def test_runner_ignores_if_jira_issue_is_not_readable(
@@ -341,9 +341,9 @@ async def test_execute_or_queue_http_error_details(
     bugzilla_webhook_request,
     context_comment_example,
     mocked_responses,
+    settings,
 ):
     bug = bugzilla_webhook_request.bug
-    settings = get_settings()
     mocked_responses.add(
         responses.GET,
         f"{settings.bugzilla_base_url}/rest/bug/{bug.id}",
@@ -408,11 +408,11 @@ def test_default_logs_all_received_responses(
     capturelogs,
     context_comment_example: ActionContext,
     action_params_factory,
+    settings,
 ):
     # In this test, we don't mock the Jira and Bugzilla clients
     # because we want to make sure that actual responses objects are logged
     # successfully.
-    settings = get_settings()
     url = f"{settings.jira_base_url}rest/api/2/issue/JBI-234/comment"
     mocked_responses.add(
         responses.POST,
@@ -432,11 +432,7 @@ def test_default_logs_all_received_responses(
     with capturelogs.for_logger("jbi.runner").at_level(logging.DEBUG):
         action(context=context_comment_example)
 
-    captured_log_msgs = (
-        (r.msg % r.args, r.response)
-        for r in capturelogs.records
-        if r.name == "jbi.runner"
-    )
+    captured_log_msgs = ((r.getMessage(), r.response) for r in capturelogs.records)
 
     assert (
         "Received {'id': '10000', 'key': 'ED-24'}",
@@ -471,6 +467,7 @@ def test_counter_is_incremented_when_workflows_was_aborted(
     action_context_factory,
     action_factory,
     action_params_factory,
+    mocked_runner_statsd,
 ):
     context_create_example: ActionContext = action_context_factory(
         operation=Operation.CREATE,
@@ -484,11 +481,10 @@ def test_counter_is_incremented_when_workflows_was_aborted(
         action_params_factory(jira_project_key=context_create_example.jira.project)
     )
 
-    with mock.patch("jbi.runner.statsd") as mocked:
-        with pytest.raises(requests.HTTPError):
-            callable_object(context=context_create_example)
+    with pytest.raises(requests.HTTPError):
+        callable_object(context=context_create_example)
 
-    mocked.incr.assert_called_with("jbi.action.fnx.aborted.count")
+    mocked_runner_statsd.incr.assert_called_with("jbi.action.fnx.aborted.count")
 
 
 def test_counter_is_incremented_when_workflows_was_incomplete(
@@ -497,6 +493,7 @@ def test_counter_is_incremented_when_workflows_was_incomplete(
     action_factory,
     bug_factory,
     action_params_factory,
+    mocked_runner_statsd,
 ):
     context_create_example: ActionContext = action_context_factory(
         operation=Operation.CREATE,
@@ -520,24 +517,22 @@ def test_counter_is_incremented_when_workflows_was_incomplete(
         )
     )
 
-    with mock.patch("jbi.runner.statsd") as mocked:
-        callable_object(context=context_create_example)
+    callable_object(context=context_create_example)
 
-    mocked.incr.assert_called_with("jbi.action.fnx.incomplete.count")
+    mocked_runner_statsd.incr.assert_called_with("jbi.action.fnx.incomplete.count")
 
 
 def test_step_function_counter_incremented_for_success(
-    action_params_factory, action_context_factory
+    action_params_factory, action_context_factory, mocked_runner_statsd
 ):
     context = action_context_factory(operation=Operation.CREATE)
     executor = Executor(action_params_factory(steps={"new": ["create_issue"]}))
-    with mock.patch("jbi.runner.statsd") as mocked:
-        executor(context=context)
-    mocked.incr.assert_called_with("jbi.steps.create_issue.count")
+    executor(context=context)
+    mocked_runner_statsd.incr.assert_called_with("jbi.steps.create_issue.count")
 
 
 def test_step_function_counter_not_incremented_for_noop(
-    action_params_factory, action_context_factory
+    action_params_factory, action_context_factory, mocked_runner_statsd
 ):
     context = action_context_factory(operation=Operation.UPDATE, jira__issue="JBI-234")
     assert not context.event.changed_fields()
@@ -545,26 +540,24 @@ def test_step_function_counter_not_incremented_for_noop(
         action_params_factory(steps={"existing": ["update_issue_summary"]})
     )
     # update_issue_summary without a changed summary will result in a NOOP
-    with mock.patch("jbi.runner.statsd") as mocked:
-        executor(context=context)
-    mocked.incr.assert_not_called()
+    executor(context=context)
+    mocked_runner_statsd.incr.assert_not_called()
 
 
 def test_counter_is_incremented_for_create(
-    webhook_request_factory, actions, mocked_bugzilla, bug_factory
+    webhook_request_factory, actions, mocked_bugzilla, bug_factory, mocked_runner_statsd
 ):
     webhook_payload = webhook_request_factory(
         event__target="bug",
         bug__see_also=[],
     )
     mocked_bugzilla.get_bug.return_value = webhook_payload.bug
-    with mock.patch("jbi.runner.statsd") as mocked:
-        execute_action(request=webhook_payload, actions=actions)
-    mocked.incr.assert_any_call("jbi.operation.create.count")
+    execute_action(request=webhook_payload, actions=actions)
+    mocked_runner_statsd.incr.assert_any_call("jbi.operation.create.count")
 
 
 def test_counter_is_incremented_for_update(
-    actions, webhook_request_factory, mocked_bugzilla, mocked_jira
+    actions, webhook_request_factory, mocked_bugzilla, mocked_jira, mocked_runner_statsd
 ):
     webhook_payload = webhook_request_factory(
         event__target="bug",
@@ -572,13 +565,12 @@ def test_counter_is_incremented_for_update(
     )
     mocked_bugzilla.get_bug.return_value = webhook_payload.bug
     mocked_jira.get_issue.return_value = {"fields": {"project": {"key": "JBI"}}}
-    with mock.patch("jbi.runner.statsd") as mocked:
-        execute_action(request=webhook_payload, actions=actions)
-    mocked.incr.assert_any_call("jbi.operation.update.count")
+    execute_action(request=webhook_payload, actions=actions)
+    mocked_runner_statsd.incr.assert_any_call("jbi.operation.update.count")
 
 
 def test_counter_is_incremented_for_comment(
-    actions, webhook_request_factory, mocked_bugzilla, mocked_jira
+    actions, webhook_request_factory, mocked_bugzilla, mocked_jira, mocked_runner_statsd
 ):
     webhook_payload = webhook_request_factory(
         event__target="comment",
@@ -586,13 +578,12 @@ def test_counter_is_incremented_for_comment(
     )
     mocked_bugzilla.get_bug.return_value = webhook_payload.bug
     mocked_jira.get_issue.return_value = {"fields": {"project": {"key": "JBI"}}}
-    with mock.patch("jbi.runner.statsd") as mocked:
-        execute_action(request=webhook_payload, actions=actions)
-    mocked.incr.assert_any_call("jbi.operation.comment.count")
+    execute_action(request=webhook_payload, actions=actions)
+    mocked_runner_statsd.incr.assert_any_call("jbi.operation.comment.count")
 
 
 def test_counter_is_incremented_for_attachment(
-    actions, webhook_request_factory, mocked_bugzilla, mocked_jira
+    actions, webhook_request_factory, mocked_bugzilla, mocked_jira, mocked_runner_statsd
 ):
     webhook_payload = webhook_request_factory(
         event__target="attachment",
@@ -600,9 +591,8 @@ def test_counter_is_incremented_for_attachment(
     )
     mocked_bugzilla.get_bug.return_value = webhook_payload.bug
     mocked_jira.get_issue.return_value = {"fields": {"project": {"key": "JBI"}}}
-    with mock.patch("jbi.runner.statsd") as mocked:
-        execute_action(request=webhook_payload, actions=actions)
-    mocked.incr.assert_any_call("jbi.operation.attachment.count")
+    execute_action(request=webhook_payload, actions=actions)
+    mocked_runner_statsd.incr.assert_any_call("jbi.operation.attachment.count")
 
 
 @pytest.mark.parametrize(
@@ -618,7 +608,7 @@ def test_counter_is_incremented_for_attachment(
     ],
 )
 def test_lookup_action_found(whiteboard, actions, bug_factory):
-    bug = bug_factory(id=1234, whiteboard=whiteboard)
+    bug = bug_factory.build(id=1234, whiteboard=whiteboard)
     action = lookup_action(bug, actions)
     assert action.whiteboard_tag == "devtest"
     assert "test config" in action.description
@@ -647,7 +637,7 @@ def test_lookup_action_found(whiteboard, actions, bug_factory):
     ],
 )
 def test_lookup_action_not_found(whiteboard, actions, bug_factory):
-    bug = bug_factory(id=1234, whiteboard=whiteboard)
+    bug = bug_factory.build(id=1234, whiteboard=whiteboard)
     with pytest.raises(ActionNotFoundError) as exc_info:
         lookup_action(bug, actions)
     assert str(exc_info.value) == "devtest"
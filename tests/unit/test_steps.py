@@ -1,4 +1,5 @@
 import logging
+from types import MappingProxyType
 from unittest import mock
 
 import pytest
@@ -31,6 +32,21 @@ ALL_STEPS = {
     ],
 }
 
+# Read-only, since it is shared by all the tests that need a status map.
+STATUS_MAP = MappingProxyType(
+    {
+        "ASSIGNED": "In Progress",
+        "FIXED": "Closed",
+    }
+)
+
+EXPECTED_CREATE_FIELDS = {
+    "summary": "JBI Test",
+    "issuetype": {"name": "Bug"},
+    "description": "Initial comment",
+    "project": {"key": "JBI"},
+}
+
 
 def test_created_public(
     context_create_example: ActionContext,
@@ -51,59 +67,24 @@ def test_created_public(
 
     callable_object(context=context_create_example)
 
-    mocked_jira.create_issue.assert_called_once_with(
-        fields={
-            "summary": "JBI Test",
-            "issuetype": {"name": "Bug"},
-            "description": "Initial comment",
-            "project": {"key": "JBI"},
-        },
-    )
+    mocked_jira.create_issue.assert_called_once_with(fields=EXPECTED_CREATE_FIELDS)
 
     mocked_bugzilla.update_bug.assert_called_once_with(
         654321, see_also={"add": [f"{settings.jira_base_url}browse/k"]}
     )
 
 
-def test_created_with_custom_issue_type_and_fallback(
-    action_context_factory,
-    mocked_jira,
-    mocked_bugzilla,
-    action_params_factory,
-    comment_factory,
-):
-    action_context = action_context_factory(
-        operation=Operation.CREATE, bug__type="enhancement"
-    )
-    mocked_jira.create_issue.return_value = {"key": "k"}
-    mocked_bugzilla.get_bug.return_value = action_context.bug
-    mocked_bugzilla.get_comments.return_value = [
-        comment_factory(text="Initial comment")
-    ]
-
-    callable_object = Executor(
-        action_params_factory(
-            jira_project_key=action_context.jira.project,
-            steps={"new": ["create_issue"]},
-            issue_type_map={
-                "task": "Epic",
-            },
-        )
-    )
-
-    callable_object(context=action_context)
-
-    mocked_jira.create_issue.assert_called_once_with(
-        fields={
-            "summary": "JBI Test",
-            "issuetype": {"name": "Task"},
-            "description": "Initial comment",
-            "project": {"key": "JBI"},
-        },
-    )
-
-
+@pytest.mark.parametrize(
+    "bug_type,expected_issue_type",
+    [
+        ("task", "Epic"),
+        ("enhancement", "Task"),
+    ],
+    ids=["mapped", "fallback"],
+)
 def test_created_with_custom_issue_type(
+    bug_type,
+    expected_issue_type,
     action_context_factory,
     mocked_jira,
     mocked_bugzilla,
@@ -111,7 +92,7 @@ def test_created_with_custom_issue_type(
     comment_factory,
 ):
     action_context = action_context_factory(
-        operation=Operation.CREATE, bug__type="task"
+        operation=Operation.CREATE, bug__type=bug_type
     )
     mocked_jira.create_issue.return_value = {"key": "k"}
     mocked_bugzilla.get_bug.return_value = action_context.bug
@@ -134,7 +115,7 @@ def test_created_with_custom_issue_type(
     mocked_jira.create_issue.assert_called_once_with(
         fields={
             "summary": "JBI Test",
-            "issuetype": {"name": "Epic"},
+            "issuetype": {"name": expected_issue_type},
             "description": "Initial comment",
             "project": {"key": "JBI"},
         },
@@ -346,14 +327,7 @@ def test_create_with_assignee(
     )
     callable_object(context=action_context)
 
-    mocked_jira.create_issue.assert_called_once_with(
-        fields={
-            "summary": "JBI Test",
-            "issuetype": {"name": "Bug"},
-            "description": "Initial comment",
-            "project": {"key": "JBI"},
-        },
-    )
+    mocked_jira.create_issue.assert_called_once_with(fields=EXPECTED_CREATE_FIELDS)
     mocked_jira.user_find_by_user_string.assert_called_once_with(
         query="dtownsend@mozilla.com"
     )
@@ -388,7 +362,7 @@ def test_clear_assignee(
     callable_object(context=action_context)
 
     mocked_jira.user_find_by_user_string.assert_not_called()
-    mocked_jira.update_issue_field.assert_any_call(
+    mocked_jira.update_issue_field.assert_called_once_with(
         key="JBI-234",
         fields={"assignee": None},
     )
@@ -426,7 +400,7 @@ def test_set_assignee(
     mocked_jira.user_find_by_user_string.assert_called_once_with(
         query="dtownsend@mozilla.com"
     )
-    mocked_jira.update_issue_field.assert_any_call(
+    mocked_jira.update_issue_field.assert_called_once_with(
         key="JBI-234",
         fields={"assignee": {"accountId": "6254"}},
     )
@@ -444,7 +418,7 @@ def test_set_assignee_failing_create(
         bug__assigned_to="postmaster@localhost",
     )
     mocked_jira.update_issue_field.side_effect = requests.exceptions.HTTPError(
-        "unknown user", response=mock.MagicMock(status_code=400)
+        "unknown user", response=mock.Mock(status_code=400)
     )
 
     with capturelogs.for_logger("jbi.steps").at_level(logging.DEBUG):
@@ -490,57 +464,25 @@ def test_set_assignee_failing_update(
     )
 
 
-def test_create_with_unknown_status(
-    action_context_factory,
-    mocked_jira,
-    mocked_bugzilla,
-    action_params_factory,
-    comment_factory,
-):
-    action_context = action_context_factory(
-        operation=Operation.CREATE, bug__status="NEW", bug__resolution=""
-    )
-
-    mocked_bugzilla.get_bug.return_value = action_context.bug
-    mocked_bugzilla.get_comments.return_value = [
-        comment_factory(text="Initial comment")
-    ]
-    mocked_jira.create_issue.return_value = {"key": "new-id"}
-
-    callable_object = Executor(
-        action_params_factory(
-            jira_project_key=action_context.jira.project,
-            steps=ALL_STEPS,
-            status_map={
-                "ASSIGNED": "In Progress",
-                "FIXED": "Closed",
-            },
-        )
-    )
-    callable_object(context=action_context)
-
-    mocked_jira.create_issue.assert_called_once_with(
-        fields={
-            "summary": "JBI Test",
-            "issuetype": {"name": "Bug"},
-            "description": "Initial comment",
-            "project": {"key": "JBI"},
-        },
-    )
-    mocked_jira.user_find_by_user_string.assert_not_called()
-    mocked_jira.update_issue_field.assert_not_called()
-    mocked_jira.set_issue_status.assert_not_called()
-
-
-def test_create_with_known_status(
+@pytest.mark.parametrize(
+    "bug_status,expected_status_calls",
+    [
+        ("NEW", []),
+        ("ASSIGNED", [mock.call("JBI-534", "In Progress")]),
+    ],
+    ids=["unknown", "known"],
+)
+def test_create_with_status(
     action_context_factory,
     mocked_jira,
     mocked_bugzilla,
     action_params_factory,
     comment_factory,
+    bug_status,
+    expected_status_calls,
 ):
     action_context = action_context_factory(
-        operation=Operation.CREATE, bug__status="ASSIGNED", bug__resolution=""
+        operation=Operation.CREATE, bug__status=bug_status, bug__resolution=""
     )
 
     # Make sure the bug fetched the second time in `create_and_link_issue()` also has the status.
@@ -554,25 +496,15 @@ def test_create_with_known_status(
         action_params_factory(
             jira_project_key=action_context.jira.project,
             steps=ALL_STEPS,
-            status_map={
-                "ASSIGNED": "In Progress",
-                "FIXED": "Closed",
-            },
+            status_map=STATUS_MAP,
         )
     )
     callable_object(context=action_context)
 
-    mocked_jira.create_issue.assert_called_once_with(
-        fields={
-            "summary": "JBI Test",
-            "issuetype": {"name": "Bug"},
-            "description": "Initial comment",
-            "project": {"key": "JBI"},
-        },
-    )
+    mocked_jira.create_issue.assert_called_once_with(fields=EXPECTED_CREATE_FIELDS)
     mocked_jira.user_find_by_user_string.assert_not_called()
     mocked_jira.update_issue_field.assert_not_called()
-    mocked_jira.set_issue_status.assert_called_once_with("JBI-534", "In Progress")
+    assert mocked_jira.set_issue_status.call_args_list == expected_status_calls
 
 
 def test_change_to_unknown_status(
@@ -594,10 +526,7 @@ def test_change_to_unknown_status(
     with capturelogs.for_logger("jbi.steps").at_level(logging.DEBUG):
         action_params = action_params_factory(
             jira_project_key=action_context.jira.project,
-            status_map={
-                "ASSIGNED": "In Progress",
-                "FIXED": "Closed",
-            },
+            status_map=STATUS_MAP,
         )
         result, _ = steps.maybe_update_issue_status(
             action_context,
@@ -638,10 +567,7 @@ def test_change_to_known_status(
         action_params_factory(
             jira_project_key=action_context.jira.project,
             steps=ALL_STEPS,
-            status_map={
-                "ASSIGNED": "In Progress",
-                "FIXED": "Closed",
-            },
+            status_map=STATUS_MAP,
         )
     )
     callable_object(context=action_context)
@@ -674,10 +600,7 @@ def test_change_to_known_resolution(
 
     params = action_params_factory(
         jira_project_key=action_context.jira.project,
-        status_map={
-            "ASSIGNED": "In Progress",
-            "FIXED": "Closed",
-        },
+        status_map=STATUS_MAP,
     )
     steps.maybe_update_issue_status(
         action_context, parameters=params, jira_service=JiraService(mocked_jira)
@@ -1300,7 +1223,7 @@ def test_maybe_update_components_failing(
         {"id": 2, "name": action_context.bug.product_component},
     ]
     mocked_jira.update_issue_field.side_effect = requests.exceptions.HTTPError(
-        "Field 'components' cannot be set", response=mock.MagicMock(status_code=400)
+        "Field 'components' cannot be set", response=mock.Mock(status_code=400)
     )
 
     action_params = action_params_factory(jira_project_key=action_context.jira.project)
@@ -1318,62 +1241,58 @@ def test_maybe_update_components_failing(
     ]
 
 
+@pytest.mark.parametrize(
+    "whiteboard,labels_brackets,expected",
+    [
+        (None, "no", ["bugzilla"]),
+        ("", "no", ["bugzilla"]),
+        ("[devtest]", "no", ["bugzilla", "devtest"]),
+        ("[devtest]", "yes", ["bugzilla", "[devtest]"]),
+        ("[devtest]", "both", ["bugzilla", "devtest", "[devtest]"]),
+        ("[test whiteboard]", "no", ["bugzilla", "test.whiteboard"]),
+        ("[test-whiteboard]", "no", ["bugzilla", "test-whiteboard"]),
+        ("[ test whiteboard ]", "no", ["bugzilla", "test.whiteboard"]),
+        ("[one][two] [three]", "no", ["bugzilla", "one", "two", "three"]),
+        ("[unclosed", "no", ["bugzilla", "unclosed"]),
+        (
+            "[test whiteboard][test-no-space][test-both space-and-not",
+            "both",
+            [
+                "bugzilla",
+                "test.whiteboard",
+                "test-no-space",
+                "test-both.space-and-not",
+                "[test.whiteboard]",
+                "[test-no-space]",
+                "[test-both.space-and-not]",
+            ],
+        ),
+    ],
+)
 def test_sync_whiteboard_labels(
     action_context_factory,
     mocked_jira,
     action_params_factory,
+    whiteboard,
+    labels_brackets,
+    expected,
 ):
     action_context = action_context_factory(
-        operation=Operation.CREATE, jira__issue="JBI-123"
+        operation=Operation.CREATE, jira__issue="JBI-123", bug__whiteboard=whiteboard
     )
 
     callable_object = Executor(
         action_params_factory(
             jira_project_key=action_context.jira.project,
             steps={"new": ["sync_whiteboard_labels"]},
+            labels_brackets=labels_brackets,
         )
     )
     callable_object(context=action_context)
 
     mocked_jira.update_issue.assert_called_once_with(
         issue_key=action_context.jira.issue,
-        update={
-            "update": {
-                "labels": [
-                    {"add": "bugzilla"},
-                    {"add": "devtest"},
-                ]
-            }
-        },
-    )
-
-
-def test_sync_whiteboard_labels_with_brackets(
-    action_context_factory, mocked_jira, action_params_factory
-):
-    action_context = action_context_factory(
-        operation=Operation.CREATE, jira__issue="JBI-123"
-    )
-    callable_object = Executor(
-        action_params_factory(
-            jira_project_key=action_context.jira.project,
-            steps={"new": ["sync_whiteboard_labels"]},
-            labels_brackets="both",
-        )
-    )
-    callable_object(context=action_context)
-
-    mocked_jira.update_issue.assert_called_once_with(
-        issue_key=action_context.jira.issue,
-        update={
-            "update": {
-                "labels": [
-                    {"add": "bugzilla"},
-                    {"add": "devtest"},
-                    {"add": "[devtest]"},
-                ]
-            }
-        },
+        update={"update": {"labels": [{"add": label} for label in expected]}},
     )
 
 
@@ -1424,7 +1343,7 @@ def test_sync_whiteboard_labels_failing(
     action_params_factory,
 ):
     mocked_jira.update_issue.side_effect = requests.exceptions.HTTPError(
-        "some message", response=mock.MagicMock(status_code=400)
+        "some message", response=mock.Mock(status_code=400)
     )
     action_context = action_context_factory(
         current_step="sync_whiteboard_labels", jira__issue="JBI-123"
@@ -1526,7 +1445,7 @@ def test_sync_keywords_labels_failing(
     action_params_factory,
 ):
     mocked_jira.update_issue.side_effect = requests.exceptions.HTTPError(
-        "some message", response=mock.MagicMock(status_code=400)
+        "some message", response=mock.Mock(status_code=400)
     )
     action_context = action_context_factory(
         current_step="sync_keywords_labels", jira__issue="JBI-123"